@@ -1,4 +1,4 @@
-from os import environ
+from os import environ, path
 
 from mkdocs.config import Config, config_options as opt
 
@@ -8,6 +8,9 @@ class EvalDocsLoaderConfig(Config):
     api_key = opt.Type(str)
     max_workers = opt.Type(int, default=0)
 
+    # Directory for the caches persisted between builds (ETags, doc blobs)
+    cache_dir = opt.Type(str, default=path.join(path.expanduser("~"), ".cache", "evaldocsloader"))
+
     # GitHub options
     github_owner = opt.Type(str, default="lambda-feedback")
     github_topic = opt.Type(str, default="evaluation-function")
@@ -1,27 +1,80 @@
 
 import requests as rq
+from requests.adapters import HTTPAdapter, Retry
 import os
 import tempfile
 import logging
-import ujson
+import orjson
 import concurrent.futures
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 
-from github import Github, Auth
-from github.Repository import Repository
-
-from .loader_base import DocsLoader, Docs, FunctionConfig
+from .loader_base import DocsLoader, Docs, DocsBundle, FunctionConfig, RepoInfo
 from .config import EvalDocsLoaderConfig
-from .loader_fetch import FetchDocsJob
+from .loader_fetch import FetchDocsJob, RepoTree, configure_blob_cache, teardown_renderer
 
 logger = logging.getLogger("mkdocs.plugin.evaldocsloader.loader")
 
+GITHUB_GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+
+CATEGORIES = ("user", "dev")
+
+# one paginated search query returns the repositories together with their
+# config.json blobs and default branch heads, so discovering N functions
+# costs ceil(N / 100) round trips instead of a search page plus a contents
+# request per repository
+REPO_SEARCH_QUERY = """
+query ($query: String!, $cursor: String) {
+    search(query: $query, type: REPOSITORY, first: 100, after: $cursor) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {
+            ... on Repository {
+                nameWithOwner
+                name
+                url
+                defaultBranchRef {
+                    name
+                    target {
+                        oid
+                    }
+                }
+                config: object(expression: "HEAD:config.json") {
+                    ... on Blob {
+                        text
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+def _tempdir_base() -> Optional[str]:
+    """
+    Pick the base directory for the intermediate docs files. An explicit
+    `EVALDOCSLOADER_TMPDIR` wins; otherwise prefer `/dev/shm` so the
+    intermediate files land on tmpfs instead of a disk-backed spool
+    directory. Returns None to fall back to the platform default.
+    """
+    override = os.environ.get("EVALDOCSLOADER_TMPDIR")
+    if override:
+        return override
+
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+
+    return None
+
 class FunctionLoader(DocsLoader):
 
     _config: EvalDocsLoaderConfig
     _dir: tempfile.TemporaryDirectory
-    _github: Github
     _max_workers: int
+    _category_dirs: Dict[str, str]
+    _session: rq.Session
+    _etag_cache_file: str
 
     def __init__(self, config: EvalDocsLoaderConfig) -> None:
         if not config.functions_announce_endpoint:
@@ -43,50 +96,191 @@ class FunctionLoader(DocsLoader):
             raise ValueError("Max workers must be greater than or equal to 0")
 
         self._config = config
-        self._max_workers = min(32, config.max_workers if config.max_workers > 0 else (os.cpu_count() or 1) + 4)
-        self._github = Github(auth=Auth.Token(config.github_token), pool_size=self._max_workers)
+        # upper bound for the connection pools; the per-build worker count is
+        # derived from the repository count in load()
+        self._max_workers = config.max_workers if config.max_workers > 0 else 32
+
+        # the caches persisted between builds all live under the configured
+        # cache directory
+        self._etag_cache_file = os.path.join(config.cache_dir, "etags.json")
+        configure_blob_cache(config.cache_dir)
+
+        # one pooled session shared by all workers, so repeated requests
+        # reuse kept-alive connections instead of paying a TLS handshake
+        # each, and transient gateway errors are retried with backoff
+        self._session = rq.Session()
+        self._session.headers["Authorization"] = f"token {config.github_token}"
+
+        adapter = HTTPAdapter(
+            pool_connections=self._max_workers,
+            pool_maxsize=self._max_workers,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def load(self) -> List[Docs]:
         logger.info("Fetching Evaluation Function documentation...")
 
-        try:
-            # get all of the function repositories
-            repos = self._get_functions_repos()
+        # get all of the function repositories, along with their raw
+        # config.json contents
+        repos, config_blobs = self._get_functions_repos()
 
-            # get the metadata for the functions
-            meta = self._get_functions_meta()
+        # get the metadata for the functions
+        meta = self._get_functions_meta()
 
-            # create a temporary directory to store the documentation
-            self._dir = tempfile.TemporaryDirectory(prefix='mkdocs_eval_docs_')
+        # parse the function configs for all repositories
+        configs = self._get_function_configs(repos, config_blobs)
 
-            # create the directories for the documentation
-            for category in ["user", "dev"]:
-                os.mkdir(os.path.join(self._dir.name, f"{category}_eval_function_docs"))
-
-            docs = []
+        # create a temporary directory to store the documentation
+        self._dir = tempfile.TemporaryDirectory(
+            prefix='mkdocs_eval_docs_',
+            dir=_tempdir_base(),
+        )
 
-            # fetch the documentation for each function
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as pool:
-                for doc in pool.map(lambda r: self._fetch_function_docs(r, meta), repos):
-                    docs.append(doc)
+        # create the directories for the documentation, precomputing the
+        # per-category paths once instead of in every fetch job
+        self._category_dirs = {
+            category: os.path.join(self._dir.name, f"{category}_eval_function_docs")
+            for category in CATEGORIES
+        }
+        # pre-create the category and per-function directories from the
+        # main thread, so the workers do pure writes instead of
+        # synchronizing on the filesystem
+        for path in self._category_dirs.values():
+            for config in configs.values():
+                os.makedirs(os.path.join(path, config.name), exist_ok=True)
+
+        # fetch the documentation for each function and category. The
+        # user and dev bundles of a repository are independent round
+        # trips, so they are submitted as sibling tasks instead of being
+        # fetched back to back inside one worker. Use as_completed
+        # instead of map so a single slow repository does not hold up
+        # consumption of the already-finished ones. A second, dedicated
+        # pool handles the supplementary file downloads so jobs can fan
+        # out their link fetches without risking pool starvation.
+        # the workload is IO bound, so scale the workers with the number
+        # of repositories (two tasks each) rather than the CPU count,
+        # unless an explicit worker count was configured
+        if self._config.max_workers > 0:
+            workers = self._config.max_workers
+        else:
+            workers = min(32, max(4, len(repos) * 2))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=workers) as fetch_pool:
+            futures = {}
+
+            for repo in repos:
+                config = configs[repo.full_name]
+
+                # warn if no metadata is found for the function
+                function_meta = meta.get(config.name)
+                if not function_meta:
+                    logger.warning(f"No deployed evaluation function found for '{config.name}'")
+                    function_meta = {}
+
+                # one lazily fetched tree listing shared by both category
+                # jobs of the repository
+                tree = RepoTree(repo, self._session)
+
+                for category in CATEGORIES:
+                    future = pool.submit(
+                        self._fetch_category_docs,
+                        category, repo, function_meta, config, tree, fetch_pool,
+                    )
+                    futures[future] = (repo, config, category)
+
+            bundles: Dict[str, Dict[str, DocsBundle]] = {}
+
+            for future in concurrent.futures.as_completed(futures):
+                repo, config, category = futures[future]
+
+                try:
+                    bundles.setdefault(config.name, {})[category] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch '{category}' docs for '{repo.name}': {e}")
+                    bundles.setdefault(config.name, {})
+
+        return [
+            Docs(
+                name=name,
+                user=result.get("user"),
+                dev=result.get("dev"),
+            )
+            for name, result in bundles.items()
+        ]
 
-            return docs
-        except Exception as e:
-            raise e
+    def _get_functions_repos(self) -> Tuple[List[RepoInfo], Dict[str, Optional[str]]]:
+        """
+        Search for the function repositories in a single paginated GraphQL
+        query that also delivers each repository's `config.json` blob inline.
 
-    def _get_functions_repos(self) -> List[Repository]:
+        Returns the repositories and the raw config contents keyed by the
+        repository full name.
+        """
         logger.info(f"Getting evaluation function repositories for topic {self._config.github_topic} in {self._config.github_owner}")
 
-        query = self._github.search_repositories(
-            f"org:{self._config.github_owner} topic:{self._config.github_topic}",
-        )
+        search_query = f"org:{self._config.github_owner} topic:{self._config.github_topic}"
+
+        repos: List[RepoInfo] = []
+        config_blobs: Dict[str, Optional[str]] = {}
+        cursor = None
 
-        repos = [repo for repo in query]
+        while True:
+            data = self._graphql(REPO_SEARCH_QUERY, {"query": search_query, "cursor": cursor})
+            search = data["search"]
+
+            for node in search["nodes"]:
+                if not node:
+                    continue
+
+                branch = node.get("defaultBranchRef") or {}
+                repos.append(RepoInfo(
+                    full_name=node["nameWithOwner"],
+                    name=node["name"],
+                    html_url=node["url"],
+                    default_branch=branch.get("name", "main"),
+                    head_sha=(branch.get("target") or {}).get("oid"),
+                ))
+
+                config_blobs[node["nameWithOwner"]] = (node.get("config") or {}).get("text")
+
+            page = search["pageInfo"]
+            if not page["hasNextPage"]:
+                break
+            cursor = page["endCursor"]
 
         logger.debug(f"Found {len(repos)} function repositories")
 
-        return repos
- 
+        return repos, config_blobs
+
+    def _graphql(self, query: str, variables: Dict) -> Dict:
+        """Post a query to the GitHub GraphQL endpoint and return its data"""
+        res = self._session.post(
+            GITHUB_GRAPHQL_ENDPOINT,
+            json={"query": query, "variables": variables},
+        )
+
+        if res.status_code != 200:
+            raise ValueError(f"GitHub GraphQL request failed: {res.status_code} {res.text}")
+
+        body = orjson.loads(res.content)
+
+        if body.get("errors"):
+            raise ValueError(f"GitHub GraphQL request failed: {body['errors']}")
+
+        data = body.get("data")
+
+        if not data:
+            raise ValueError("GitHub GraphQL request returned no data")
+
+        return data
+
     def _get_functions_meta(self) -> Dict[str, Dict]:
         """
         Fetch list of evaluation functions, and their endpoints from a directory url
@@ -95,12 +289,37 @@ class FunctionLoader(DocsLoader):
         url = self._config.functions_announce_endpoint
         logger.info(f"Getting deployed evaluation functions from {url}")
 
-        res = rq.get(url, headers={"api-key": self._config.api_key})
+        headers = {
+            "api-key": self._config.api_key,
+            # the announce endpoint must not receive the GitHub token
+            # carried in the session defaults
+            "Authorization": None,
+        }
 
-        if res.status_code != 200:
+        # replay the stored ETag so an unchanged function list is answered
+        # with a body-less 304 instead of the full payload
+        etag_cache = self._load_etag_cache()
+        cached = etag_cache.get(url)
+
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        res = self._session.get(url, headers=headers)
+
+        if res.status_code == 304 and cached:
+            logger.debug("Functions list unchanged, using cached response")
+            data = orjson.loads(cached["body"])
+        elif res.status_code != 200:
             raise ValueError(f"Coud not fetch functions list: {res.status_code} {res.text}")
-        
-        data = res.json()
+        else:
+            # skip requests' json() path in favour of orjson, matching how the
+            # rest of the loader parses payloads
+            data = orjson.loads(res.content)
+
+            etag = res.headers.get("ETag")
+            if etag:
+                etag_cache[url] = {"etag": etag, "body": res.text}
+                self._store_etag_cache(etag_cache)
 
         func_list = data.get("edges", None)
 
@@ -111,39 +330,73 @@ class FunctionLoader(DocsLoader):
 
         return {meta["name"]: meta for meta in func_list}
 
-    def _fetch_function_docs(
+    def _fetch_category_docs(
         self,
-        repo: Repository,
-        meta_map: Dict[str, Dict],
-    ) -> Docs:
-        # get the function config from the repository
-        config = self._get_function_config(repo)
-
-        # warn if no metadata is found for the function
-        if not meta_map.get(config.name):
-            logger.warning(f"No deployed evaluation function found for '{config.name}'")
-
-        meta = meta_map.get(config.name, {})
-
-        result = {}
-
-        for category in ["user", "dev"]:
-            try:
-                job = FetchDocsJob(category, repo, meta, config, self._dir.name)
-                result[category] = job.fetch()
-            except Exception as e:
-                logger.warning(f"Failed to fetch '{category}' docs for '{repo.name}': {e}")
-
-        return Docs(
-            name=config.name,
-            user=result.get("user"),
-            dev=result.get("dev"),
+        category: str,
+        repo: RepoInfo,
+        meta: Dict,
+        config: FunctionConfig,
+        tree: RepoTree,
+        fetch_pool: concurrent.futures.ThreadPoolExecutor,
+    ) -> DocsBundle:
+        job = FetchDocsJob(
+            category, repo, meta, config,
+            self._dir.name, tree, fetch_pool, self._session,
         )
 
-    def _get_function_config(self, repo: Repository) -> FunctionConfig:
+        return job.fetch()
+
+    def _get_function_configs(
+        self,
+        repos: List[RepoInfo],
+        blobs: Dict[str, Optional[str]],
+    ) -> Dict[str, FunctionConfig]:
+        """
+        Parse the function configs fetched alongside the repository search,
+        keyed by the repository full name. Repositories whose blob is missing
+        from the batched response fall back to a raw download.
+        """
+        configs: Dict[str, FunctionConfig] = {}
+
+        for repo in repos:
+            blob = blobs.get(repo.full_name)
+
+            if blob is None:
+                blob = self._download_config(repo)
+
+            configs[repo.full_name] = self._parse_function_config(repo, blob)
+
+        return configs
+
+    def _download_config(self, repo: RepoInfo) -> bytes:
+        url = f"https://raw.githubusercontent.com/{repo.full_name}/{repo.default_branch}/config.json"
+
+        logger.debug(f"Downloading {url}...")
+        res = self._session.get(url)
+
+        if res.status_code != 200:
+            raise ValueError(f"Failed to get function config for {repo.name}: {res.status_code}")
+
+        return res.content
+
+    def _load_etag_cache(self) -> Dict[str, Dict]:
+        try:
+            with open(self._etag_cache_file, "rb") as f:
+                return orjson.loads(f.read())
+        except Exception:
+            return {}
+
+    def _store_etag_cache(self, cache: Dict[str, Dict]) -> None:
         try:
-            file = repo.get_contents("config.json")
-            config = ujson.loads(file.decoded_content)
+            os.makedirs(os.path.dirname(self._etag_cache_file), exist_ok=True)
+            with open(self._etag_cache_file, "wb") as f:
+                f.write(orjson.dumps(cache))
+        except OSError as e:
+            logger.debug(f"Could not store etag cache: {e}")
+
+    def _parse_function_config(self, repo: RepoInfo, content: Union[str, bytes]) -> FunctionConfig:
+        try:
+            config = orjson.loads(content)
 
             name = config.get("EvaluationFunctionName")
             if not name:
@@ -157,6 +410,8 @@ class FunctionLoader(DocsLoader):
             raise ValueError(f"Failed to get function config for {repo.name}", e)
 
     def cleanup(self):
+        teardown_renderer()
+
         try:
             logger.info("Cleaning up downloaded files")
             self._dir.cleanup()
@@ -2,12 +2,34 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class RepoInfo:
+    """
+    The subset of repository metadata the loader needs, as returned by the
+    batched repository search
+    """
+
+    full_name: str
+    """The owner-qualified repository name (e.g. `owner/name`)"""
+
+    name: str
+    """The repository name"""
+
+    html_url: str
+    """The URL of the repository on GitHub"""
+
+    default_branch: str
+    """The name of the default branch"""
+
+    head_sha: Optional[str]
+    """The commit sha at the head of the default branch"""
+
+@dataclass(slots=True, frozen=True)
 class FunctionConfig:
     name: str
     docs_dir: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocsFile:
     """
     A documentation file
@@ -22,7 +44,7 @@ class DocsFile:
     edit_uri: Optional[str] = None
     """The URI to edit the file"""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocsBundle:
     """
     A bundle of documentation files
@@ -34,7 +56,7 @@ class DocsBundle:
     supplementary: List[DocsFile]
     """A list of supplementary documentation files"""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Docs:
     """
     Documentation files for a single evaluation function
@@ -1,11 +1,15 @@
 import os
+import re
+import shutil
 import logging
+import posixpath
 import threading
-from urllib.parse import urljoin
-from typing import Dict, Optional, List, Any, Tuple, Callable, Set
+import concurrent.futures
 
-from github.ContentFile import ContentFile
-from github.Repository import Repository
+import orjson
+import requests as rq
+from dataclasses import dataclass
+from typing import Dict, Optional, List, Any, Tuple, Callable, Set
 
 import mistletoe
 import mistletoe.markdown_renderer
@@ -16,32 +20,211 @@ import mistletoe.core_tokens
 from mistletoe.markdown_renderer import MarkdownRenderer
 from mistletoe.base_renderer import BaseRenderer
 
-from .loader_base import DocsFile, DocsBundle, FunctionConfig
+from .loader_base import DocsFile, DocsBundle, FunctionConfig, RepoInfo
 from autotests import TestFile
 
 logger = logging.getLogger("mkdocs.plugin.evaldocsloader.fetcher")
 
+_blob_cache_dir = os.path.join(
+    os.path.expanduser("~"), ".cache", "evaldocsloader", "blobs"
+)
+
+def configure_blob_cache(cache_dir: str) -> None:
+    """Point the blob cache at the configured cache directory"""
+    global _blob_cache_dir
+    _blob_cache_dir = os.path.join(cache_dir, "blobs")
+
+def _blob_cache_get(sha: str) -> Optional[bytes]:
+    try:
+        with open(os.path.join(_blob_cache_dir, sha), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _blob_cache_put(sha: str, content: bytes) -> None:
+    try:
+        os.makedirs(_blob_cache_dir, exist_ok=True)
+
+        # write via a unique temp file and rename, so concurrent workers
+        # never observe a partially written blob
+        path = os.path.join(_blob_cache_dir, sha)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache blob {sha}: {e}")
+
+def _blob_cache_put_file(sha: str, src_path: str) -> None:
+    """Cache an already-written file by copying it, without buffering it in memory"""
+    try:
+        os.makedirs(_blob_cache_dir, exist_ok=True)
+
+        path = os.path.join(_blob_cache_dir, sha)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache blob {sha}: {e}")
+
+# matches absolute link targets: any scheme (https:, mailto:, ftp:, ...) or a
+# protocol-relative //host prefix. Compiled once, as _collect_link runs for
+# every link token in every document.
+_ABSOLUTE_LINK = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:|//)", re.IGNORECASE)
+
+# The table header is the same for all generated example tables
+_TEST_TABLE_HEADER = [
+    "|Response|Answer|Correct?|",
+    "|-|-|-|",
+]
+
 renderer_lock = threading.Lock()
 
+_renderer: Optional[MarkdownRenderer] = None
+
+def _shared_renderer() -> MarkdownRenderer:
+    """
+    Return the shared markdown renderer, creating and entering it on first use.
+
+    Entering a `MarkdownRenderer` registers mistletoe's extra tokens globally,
+    which is expensive, so we do it once for the lifetime of the loader instead
+    of once per file. Must only be called while holding `renderer_lock`.
+    """
+    global _renderer
+
+    if _renderer is None:
+        _renderer = MarkdownRenderer()
+        _renderer.__enter__()
+
+    return _renderer
+
+def teardown_renderer() -> None:
+    """Tear down the shared markdown renderer, resetting mistletoe's global token state"""
+    global _renderer
+
+    with renderer_lock:
+        if _renderer is not None:
+            _renderer.__exit__(None, None, None)
+            _renderer = None
+
+@dataclass(slots=True, frozen=True)
+class RemoteFile:
+    """
+    A file downloaded from a function repository
+    """
+
+    path: str
+    """The path of the file, relative to the repository root"""
+
+    name: str
+    """The base name of the file"""
+
+    content: Optional[bytes]
+    """The raw file content, or None if the file was streamed to disk"""
+
+class RepoTree:
+    """
+    Lazily fetched tree listing of a function repository, shared between the
+    user and dev fetch jobs so each repository is listed once per build
+    instead of once per category.
+    """
+
+    _repo: RepoInfo
+    _session: rq.Session
+    _lock: threading.Lock
+    _contents: Optional[Dict[str, str]]
+    _docs_root: Optional[str]
+    _docs_root_resolved: bool
+
+    def __init__(self, repo: RepoInfo, session: rq.Session) -> None:
+        self._repo = repo
+        self._session = session
+        self._lock = threading.Lock()
+        self._contents = None
+        self._docs_root = None
+        self._docs_root_resolved = False
+
+    def contents(self) -> Dict[str, str]:
+        """Map of file paths to blob shas for the whole repository"""
+        with self._lock:
+            return self._ensure_contents()
+
+    def docs_root(self, configured: Optional[str]) -> Optional[str]:
+        """
+        Resolve the docs root once from the tree listing: the configured
+        docs dir wins, otherwise the first default location that exists in
+        the repository. Returns None if no candidate exists.
+        """
+        if configured:
+            return configured
+
+        with self._lock:
+            if not self._docs_root_resolved:
+                contents = self._ensure_contents()
+                self._docs_root = next(
+                    (
+                        candidate for candidate in ("docs", "app/docs")
+                        if any(path.startswith(f"{candidate}/") for path in contents)
+                    ),
+                    None,
+                )
+                self._docs_root_resolved = True
+
+            return self._docs_root
+
+    def _ensure_contents(self) -> Dict[str, str]:
+        """Fetch the tree listing on first use. Must be called holding the lock"""
+        if self._contents is None:
+            logger.debug(f"Listing repository tree for {self._repo.name}")
+
+            # pin the listing to the head sha from the search payload, so the
+            # tree and the raw downloads see a consistent snapshot
+            ref = self._repo.head_sha or self._repo.default_branch
+            url = f"https://api.github.com/repos/{self._repo.full_name}/git/trees/{ref}?recursive=1"
+
+            res = self._session.get(url)
+            res.raise_for_status()
+
+            data = orjson.loads(res.content)
+            self._contents = {
+                element["path"]: element["sha"]
+                for element in data.get("tree", [])
+                if element.get("type") == "blob"
+            }
+
+        return self._contents
+
 class FetchDocsJob:
     _category: str
-    _repo: Repository
+    _repo: RepoInfo
     _meta: Dict[str, Any]
     _config: FunctionConfig
     _out_dir: str
     _base_dir: str
-    _link_out_dir: str
+    _base_prefix: str
+    _out_prefix: str
     _remote_docs_dir: Optional[str]
+    _remote_docs_prefix: Optional[str]
     _visited_files: Set[str]
     _test_file: Optional[TestFile]
+    _examples_md: Optional[str]
+    _tree: RepoTree
+    _fetch_pool: concurrent.futures.ThreadPoolExecutor
+    _session: rq.Session
 
     def __init__(
         self,
         category: str,
-        repo: Repository,
+        repo: RepoInfo,
         meta: Dict[str, Any],
         config: FunctionConfig,
         out_dir: str,
+        tree: RepoTree,
+        fetch_pool: concurrent.futures.ThreadPoolExecutor,
+        session: rq.Session,
     ) -> None:
         self._category = category
         self._repo = repo
@@ -49,45 +232,102 @@ class FetchDocsJob:
         self._config = config
         self._out_dir = out_dir
         self._base_dir = f"{category}_eval_function_docs"
-        self._link_out_dir = os.path.join(self._out_dir, self._base_dir)
         self._remote_docs_dir = self._config.docs_dir
         self._visited_files = set()
         self._test_file = None
+        self._examples_md = None
+        self._tree = tree
+        self._fetch_pool = fetch_pool
+        self._session = session
+
+        # precompute the fixed path prefixes instead of re-joining them for
+        # every file and link. Generated links are markdown link targets, so
+        # they always use forward slashes.
+        self._base_prefix = f"{self._base_dir}/"
+        self._out_prefix = f"{out_dir}{os.sep}"
+        self._remote_docs_prefix = None
+        link_prefix = f"{config.name}/"
+        self._generate_link = lambda p: f"{link_prefix}{str(p).replace('/', '__')}"
 
     def fetch(self) -> DocsBundle:
         results: List[DocsFile] = []
 
-        os.mkdir(os.path.join(self._link_out_dir, self._config.name))
-
         self._fetch_test_file()
-        self._fetch_and_process_file(f"{self._category}.md", f"{self._config.name}.md", results)
+
+        # build the generated examples markdown up front in this worker, so
+        # only the parse itself happens under the renderer lock later
+        if self._test_file:
+            self._examples_md = _format_examples(self._test_file)
+
+        self._fetch_and_process_files(f"{self._category}.md", f"{self._config.name}.md", results)
 
         return DocsBundle(
             main=results[0],
             supplementary=results[1:] if len(results) > 1 else [],
         )
 
-    def _edit_url(self, file: ContentFile):
+    def _edit_url(self, file: RemoteFile):
         return f"{self._repo.html_url}/blob/{self._repo.default_branch}/{file.path}"
 
-    def _fetch_and_process_file(
+    def _fetch_and_process_files(
         self,
         remote_file_path: str,
         out_file_path: str,
         results: List[DocsFile],
-        level: int = 0
     ) -> None:
-        # if we have reached the maximum recursion depth, return
-        if level > 4:
-            logger.warning(f"Reached maximum recursion depth for '{self._config.name}'")
-            return
-
-        # fetch file from the repository
-        file = self._fetch_file(remote_file_path)
-
+        # fetch and process files level by level: all fetches for a level run
+        # in parallel on the shared pool, while the processing stays in this
+        # worker thread (it is serialized by the renderer lock anyway). The
+        # parallel fetches never touch the lazy tree listing, since the docs
+        # dir is already known once the entry file has been processed.
+        pending = [(remote_file_path, out_file_path)]
+        level = 0
+
+        while pending:
+            # if we have reached the maximum recursion depth, stop
+            if level > 4:
+                logger.warning(f"Reached maximum recursion depth for '{self._config.name}'")
+                return
+
+            futures = {}
+
+            for remote, out in pending:
+                if remote.lower().endswith(".md"):
+                    future = self._fetch_pool.submit(self._fetch_file, remote)
+                else:
+                    # non-markdown assets are streamed straight to their
+                    # output file inside the fetch task, instead of being
+                    # buffered through memory first
+                    future = self._fetch_pool.submit(self._fetch_asset, remote, out)
+
+                futures[future] = (remote, out)
+
+            pending = []
+
+            for future in concurrent.futures.as_completed(futures):
+                remote, out = futures[future]
+
+                try:
+                    file = future.result()
+                    pending.extend(self._process_fetched_file(file, out, results))
+                except Exception as e:
+                    # a failed entry file aborts the whole bundle, failed
+                    # supplementary files are only warned about
+                    if level == 0:
+                        raise
+                    logger.warning(f"Failed to fetch supplemental '{remote}' for '{self._config.name}': {e}")
+
+            level += 1
+
+    def _process_fetched_file(
+        self,
+        file: RemoteFile,
+        out_file_path: str,
+        results: List[DocsFile],
+    ) -> List[Tuple[str, str]]:
         # if we have already visited this file, return
         if file.path in self._visited_files:
-            return
+            return []
 
         # add the file to the visited files
         self._visited_files.add(file.path)
@@ -96,42 +336,48 @@ class FetchDocsJob:
         if not self._remote_docs_dir:
             self._remote_docs_dir = os.path.dirname(file.path)
 
-        out_file_path = os.path.join(self._base_dir, out_file_path)
+        out_file_path = self._base_prefix + out_file_path
+        out_path = self._out_prefix + out_file_path
 
-        # process the file and get children
-        out_data, links = self._process_file(file)
+        # compute the edit url once; it is shared by the edit button and the
+        # resulting DocsFile
+        edit_url = self._edit_url(file)
 
-        # write the file to the output directory
-        out_path = os.path.join(self._out_dir, out_file_path)
-        with open(out_path, "wb") as fw:
-            fw.write(out_data)
+        if not file.path.lower().endswith(".md"):
+            # binary assets (images etc.) never touch the markdown pipeline;
+            # a None content means the fetch task already streamed the bytes
+            # to the output file
+            if file.content is not None:
+                with open(out_path, "wb") as fw:
+                    fw.write(file.content)
+            links = []
+        else:
+            # process the file and get children
+            out_data, links = self._process_file(file, edit_url)
+
+            # write the file to the output directory in text mode so the io
+            # layer can use CPython's UTF-8 fast path instead of allocating
+            # an intermediate bytes object
+            with open(out_path, "w", encoding="utf-8", newline="") as fw:
+                fw.write(out_data)
 
         results.append(
             DocsFile(
                 dir=self._out_dir,
                 file_path=out_file_path,
-                edit_uri=self._edit_url(file),
+                edit_uri=edit_url,
             )
         )
 
-        # fetch and process all children
-        for (__remote_file_path, __out_file_path) in links:
-            try:
-                self._fetch_and_process_file(__remote_file_path, __out_file_path, results, level + 1)
-            except Exception as e:
-                logger.warning(f"Failed to fetch supplemental '{__remote_file_path}' for '{self._config.name}': {e}")
-
-    def _process_file(self, file: ContentFile) -> Tuple[bytes, List[Tuple[str, str]]]:
-        # if the file is not a markdown file, return the content as-is
-        if not file.path.lower().endswith(".md"):
-            return (file.decoded_content, [])
+        return links
 
+    def _process_file(self, file: RemoteFile, edit_url: str) -> Tuple[str, List[Tuple[str, str]]]:
         # get the content of the file as a string
-        content_str = str(file.decoded_content, "utf-8")
+        content_str = str(file.content, "utf-8")
 
-        # we have to wrap the whole rendering process in the renderer context as well
-        # as synchronize access between all threads we are spinning up because of the
-        # way mistletoe handles parsing and rendering:
+        # we have to synchronize the whole parsing and rendering process between
+        # all threads we are spinning up because of the way mistletoe handles
+        # parsing and rendering:
         #
         # 1) Multithreading support: mistletoe uses a global token index to keep track
         #    of supported tokens, which is not thread-safe. This means that we can't
@@ -139,48 +385,46 @@ class FetchDocsJob:
 
         # 2) Rendering context: mistletoe's parser and renderer are tightly coupled,
         #    with the renderer context providing supported tokens to the parser.
-        with renderer_lock, MarkdownRenderer() as renderer:
+        #    The shared renderer stays entered for the lifetime of the loader, so
+        #    the token registration cost is paid once instead of once per file.
+        with renderer_lock:
+            renderer = _shared_renderer()
             # parse the markdown document content
             doc = mistletoe.Document(content_str)
 
             # initilize the link loader. This is a special renderer that will
             # collect all links in and modify them to point to the right location.
-            # 
+            #
             # NOTE: make sure to never use it as a context manager or any of
             # its functionality, as it will interfere with the renderer context
-            link_loader = _MarkdownLinkCollector(
-                lambda p: os.path.join(self._config.name, f"{p}".replace("/", "__"))
-            )
+            link_loader = _MarkdownLinkCollector(self._generate_link)
 
             # collect and modify all links in the document
             doc = link_loader.render(doc)
 
             # run any category-specific document modifications
-            doc = self._edit_docs(doc, file)
+            doc = self._edit_docs(doc, edit_url)
 
             # render the document to markdown
             out = renderer.render(doc)
 
-            return (bytes(out, "utf-8"), link_loader.links)
+            return (out, link_loader.links)
+
+    def _edit_docs(self, doc: mistletoe.Document, edit_url: str) -> mistletoe.Document:
+        # find the index of the first heading once; every editor inserts
+        # relative to it
+        heading = _first_heading_index(doc)
 
-    def _edit_docs(self, doc: mistletoe.Document, file: ContentFile) -> mistletoe.Document:
         # first, try category-specific edits
         if edit_fn := getattr(self, f"_edit_{self._category}_docs", None):
-            doc = edit_fn(doc)
+            doc = edit_fn(doc, heading)
         else:
             logger.debug(f"No edit function found for {self._category}")
 
         # then, do common edits afterwards
-        return self._edit_docs_common(doc, file)
-
-    def _edit_user_docs(self, doc: mistletoe.Document) -> mistletoe.Document:
-        # find the index of the first heading in the document
-        heading = -1
-        for i, token in enumerate(doc.children):
-            if isinstance(token, mistletoe.block_token.Heading) and token.level == 1:
-                heading = i
-                break
+        return self._edit_docs_common(doc, heading, edit_url)
 
+    def _edit_user_docs(self, doc: mistletoe.Document, heading: int) -> mistletoe.Document:
         # insert the response areas string after the first root heading
         supported_response_types = self._meta.get("supportedResponseTypes", [])
         response_areas_content = format_response_areas(supported_response_types)
@@ -191,71 +435,21 @@ class FetchDocsJob:
         return doc
 
     def _edit_user_docs_insert_autotests(self, doc: mistletoe.Document):
-        if not self._test_file:
+        if not self._examples_md:
             return
 
-        # Insert a section at the end with examples auto-generated from tests, if a tests file exists
+        # Insert a section at the end with examples auto-generated from tests, if a tests file exists.
+        # The section markdown was pre-built in the worker thread; only the
+        # parse runs here, under the renderer lock held by the caller.
         logger.info(f"Test file found for {self._repo.name}, generating examples")
-        # Append the content to the end of the file
-        doc.children.append(mistletoe.block_token.Heading((2, "Examples from Integration Tests", None)))
-        
-        # The table header is the same for all tests
-        table_header = [
-            "|Response|Answer|Correct?|",
-            "|-|-|-|",
-        ]
-        
-        for group in self._test_file.groups:
-            doc.children.append(mistletoe.block_token.Heading((3, group.title, None)))
-            for test in group.tests:
-                if test.exclude_from_docs:
-                    continue
-                
-                doc.children.append(mistletoe.block_token.Paragraph([test.desc]))
-                doc.children.append(mistletoe.markdown_renderer.BlankLine({}))
-
-                # A buffer that allows tables for multiple sub-tests to be combined
-                table_lines = []
-                
-                # Sub tests have the same answer and parameters as a test, but a different response value
-                for sub_test in test.sub_tests:
-                    if sub_test.exclude_from_docs:
-                        continue
-                    
-                    response = sanitise_response(sub_test.response)
-                    answer = sanitise_response(test.answer)
-                    correct = "✓" if sub_test.is_correct else "✗"
-
-                    if sub_test.desc and len(table_lines) != 0:
-                        # Flush pending examples if necessary
-                        doc.children.append(mistletoe.block_token.Table((table_header + table_lines, 0)))
-                        doc.children.append(mistletoe.markdown_renderer.BlankLine({}))
-
-                        table_lines.clear()
-
-                    table_lines.append(f"|`{response}`|`{answer}`|{correct}|")
-
-                    if sub_test.desc:
-                        doc.children.append(mistletoe.block_token.Paragraph([sub_test.desc]))
-                        doc.children.append(mistletoe.markdown_renderer.BlankLine({}))
-                
-                # Flush any remaining examples
-                if len(table_lines) != 0:
-                    doc.children.append(mistletoe.block_token.Table((table_header + table_lines, 0)))
-                    doc.children.append(mistletoe.markdown_renderer.BlankLine({}))
-
-    def _edit_docs_common(self, doc: mistletoe.Document, file: ContentFile) -> mistletoe.Document:
-        # find the index of the first heading in the document
-        heading = -1
-        for i, token in enumerate(doc.children):
-            if isinstance(token, mistletoe.block_token.Heading) and token.level == 1:
-                heading = i
-                break
-
-        edit_link = self._edit_url(file)
+
+        section = mistletoe.Document(self._examples_md)
+        doc.children.extend(section.children)
+
+    def _edit_docs_common(self, doc: mistletoe.Document, heading: int, edit_url: str) -> mistletoe.Document:
         repo_link = self._repo.html_url
         edit_content = "\n".join([
-            f"[Edit on GitHub :fontawesome-solid-pen-to-square:]({edit_link}){{ .md-button }}",
+            f"[Edit on GitHub :fontawesome-solid-pen-to-square:]({edit_url}){{ .md-button }}",
             f"[View Code :fontawesome-solid-code:]({repo_link}){{ .md-button }}",
             "",
             "---",
@@ -271,69 +465,176 @@ class FetchDocsJob:
         contains a list of tests. If this file is found, it is parsed into a TestFile
         structure and stored in self._test_file.
         """
+        # a missing test file is expected; the tree listing tells us without
+        # paying a speculative request for it
+        if "eval_tests.yaml" not in self._get_tree():
+            logger.debug(f"{self._repo.name} doesn't contain a test file")
+            return
+
+        test_file = self._download("eval_tests.yaml")
+
         try:
-            test_file = self._repo.get_contents("eval_tests.yaml")
-            test_file_str = str(test_file.decoded_content, "utf-8")
+            test_file_str = str(test_file.content, "utf-8")
             # If a TestFile was successfully parsed, it is stored in self._test_file.
             # Otherwise, it is left as None
             self._test_file = TestFile(test_file_str, test_file.name)
         except Exception as e:
             logger.debug(f"{self._repo.name} doesn't contain a valid test file: {e}")
 
-    def _fetch_file(self, file_path: str, docs_dir: Optional[str] = None) -> ContentFile:
+    def _fetch_file(self, file_path: str, docs_dir: Optional[str] = None) -> RemoteFile:
         """
         Fetches a documentation file from the specified directory or the default location.
 
         Args:
-            docs_path (Optional[str]): The path to the docs root, relative to the repository root.
-            file (str): The name of the file to fetch.
+            docs_dir (Optional[str]): The path to the docs root, relative to the repository root.
+            file_path (str): The name of the file to fetch.
 
         Returns:
-            ContentFile: The fetched documentation file.
+            RemoteFile: The fetched documentation file.
 
         Raises:
-            Exception: If the file cannot be found in the specified directory or the default location.
+            FileNotFoundError: If the file cannot be found in the specified directory or the default location.
         """
-        # if we have no clue where to look, try to locate the file
-        if not docs_dir and not self._remote_docs_dir:
-            return self._locate_file(file_path)
+        return self._download(self._resolve_remote_path(file_path, docs_dir))
 
-        # if we do not have a specific docs_dir, but we have one defined, use that
-        if not docs_dir and self._remote_docs_dir:
-            docs_dir = self._remote_docs_dir
+    def _fetch_asset(self, file_path: str, out_file_path: str) -> RemoteFile:
+        """
+        Fetch a non-markdown asset, streaming it straight to its output file
+        instead of buffering it through memory. The returned RemoteFile
+        carries no content; the bytes are already on disk.
+        """
+        path = self._resolve_remote_path(file_path)
+        out_path = self._out_prefix + self._base_prefix + out_file_path
 
-        # we know we have a docs_dir, so we can try to fetch the file from there
-        docs_dir = docs_dir.strip("/")
-        docs_dir = f"{docs_dir}/"
-        path = urljoin(docs_dir, file_path)
+        sha = self._get_tree().get(path)
+        content = _blob_cache_get(sha) if sha else None
 
-        logger.debug(f"Trying to fetch {path}...")
-        content = self._repo.get_contents(path)
+        if content is not None:
+            with open(out_path, "wb") as fw:
+                fw.write(content)
+        else:
+            ref = self._repo.head_sha or self._repo.default_branch
+            url = f"https://raw.githubusercontent.com/{self._repo.full_name}/{ref}/{path}"
 
-        return content
+            logger.debug(f"Downloading {url}...")
+            with self._session.get(url, stream=True) as res:
+                res.raise_for_status()
 
-    def _locate_file(self, file_path: str):
-        try:
-            # try to get the file from the default location
-            logger.debug(f"Trying to fetch {file_path} from 'docs'...")
-            return self._fetch_file(file_path, "docs")
-        except Exception:
-            # if the default location does not exist, try the app/docs location
-            logger.debug(f"Could not find docs in 'docs', trying 'app/docs'...")
-            return self._fetch_file(file_path, "app/docs")
+                with open(out_path, "wb") as fw:
+                    for chunk in res.iter_content(chunk_size=1 << 16):
+                        fw.write(chunk)
+
+            if sha:
+                _blob_cache_put_file(sha, out_path)
+
+        return RemoteFile(
+            path=path,
+            name=os.path.basename(path),
+            content=None,
+        )
+
+    def _resolve_remote_path(self, file_path: str, docs_dir: Optional[str] = None) -> str:
+        """Resolve a docs-relative file path against the repository tree"""
+        # the docs root was resolved once from the tree listing, so there is
+        # no speculative request (and no 404) per candidate location; its
+        # normalized prefix is cached so the common path is one concatenation
+        if docs_dir:
+            prefix = f"{docs_dir.strip('/')}/"
+        else:
+            if self._remote_docs_prefix is None:
+                root = self._remote_docs_dir or self._tree.docs_root(self._config.docs_dir)
+
+                if not root:
+                    raise FileNotFoundError(
+                        f"Could not find a docs directory in {self._repo.name}"
+                    )
+
+                self._remote_docs_prefix = f"{root.strip('/')}/"
+
+            prefix = self._remote_docs_prefix
+
+        path = prefix + file_path
+
+        if "./" in file_path:
+            # links may climb out of the docs root via ./ or ../ segments
+            path = posixpath.normpath(path)
+
+        if path not in self._get_tree():
+            raise FileNotFoundError(
+                f"Could not find '{file_path}' in '{prefix}' of {self._repo.name}"
+            )
+
+        return path
+
+    def _download(self, path: str) -> RemoteFile:
+        """
+        Download a file straight from raw.githubusercontent.com on the shared
+        pooled session, skipping the contents API and its base64 encoding.
+
+        Blobs are cached on disk keyed by their git sha (content-addressed,
+        so a matching sha is always current), which makes mkdocs rebuilds of
+        unchanged files local-disk reads.
+        """
+        sha = self._get_tree().get(path)
+        content = _blob_cache_get(sha) if sha else None
+
+        if content is None:
+            ref = self._repo.head_sha or self._repo.default_branch
+            url = f"https://raw.githubusercontent.com/{self._repo.full_name}/{ref}/{path}"
+
+            logger.debug(f"Downloading {url}...")
+            res = self._session.get(url)
+            res.raise_for_status()
+
+            content = res.content
+
+            if sha:
+                _blob_cache_put(sha, content)
+
+        return RemoteFile(
+            path=path,
+            name=os.path.basename(path),
+            content=content,
+        )
+
+    def _get_tree(self) -> Dict[str, str]:
+        """
+        The tree listing of the repository, mapping file paths to blob shas.
+        A single recursive tree call, shared with the sibling category job,
+        replaces the per-file existence probes.
+        """
+        return self._tree.contents()
+
+# cache of the render dispatch maps built by `BaseRenderer.__init__`, keyed by
+# the concrete renderer class. The maps are stored with plain (unbound)
+# functions so they can be re-bound cheaply for every new instance.
+_RENDER_MAP_CACHE: Dict[type, Dict[str, Callable]] = {}
 
 class _MarkdownLinkCollector(BaseRenderer):
     _generate_link: Callable[[str], str]
     _links: List[Tuple[str, str]]
 
     def __init__(self, generate_link: Callable[[str], str]) -> None:
-        # make sure we don't change the renderer's tokens, as supported tokens
-        # are managed globally, which will also interfere with the MarkdownRenderer.
-        super().__init__()
+        cached = _RENDER_MAP_CACHE.get(type(self))
+
+        if cached is None:
+            # make sure we don't change the renderer's tokens, as supported tokens
+            # are managed globally, which will also interfere with the MarkdownRenderer.
+            super().__init__()
+            # TODO: add all other tokens supported by the MarkdownRenderer
+            self.render_map["BlankLine"] = self.render_blank_line
+            _RENDER_MAP_CACHE[type(self)] = {
+                name: func.__func__ for name, func in self.render_map.items()
+            }
+        else:
+            # re-binding the cached functions is cheaper than letting
+            # `BaseRenderer.__init__` rebuild the whole dispatch map
+            self.render_map = {name: func.__get__(self) for name, func in cached.items()}
+            self._extras = ()
+            self.footnotes = {}
+
         self._links = []
         self._generate_link = generate_link
-        # TODO: add all other tokens supported by the MarkdownRenderer
-        self.render_map["BlankLine"] = self.render_blank_line
     
     def render_inner(self, token: mistletoe.token.Token) -> mistletoe.token.Token:
         if token.children:
@@ -361,8 +662,9 @@ class _MarkdownLinkCollector(BaseRenderer):
         return token
     
     def _collect_link(self, link_url: str) -> None:
-        # only fetch relative links
-        if link_url.startswith("http"):
+        # only fetch relative links; absolute targets (any scheme or a
+        # protocol-relative url) and in-page anchors pass through untouched
+        if link_url.startswith("#") or _ABSOLUTE_LINK.match(link_url):
             return link_url
 
         out_link = self._generate_link(link_url)
@@ -371,20 +673,83 @@ class _MarkdownLinkCollector(BaseRenderer):
 
         return out_link
 
+def _format_examples(test_file: TestFile) -> str:
+    """
+    Format the examples section generated from a test file as one markdown
+    string. Pure string building, safe to run outside the renderer lock.
+    """
+    lines: List[str] = ["## Examples from Integration Tests", ""]
+
+    for group in test_file.groups:
+        lines.append(f"### {group.title}")
+        lines.append("")
+
+        for test in group.tests:
+            if test.exclude_from_docs:
+                continue
+
+            lines.append(test.desc)
+            lines.append("")
+
+            # A buffer that allows tables for multiple sub-tests to be combined
+            table_lines = []
+
+            # Sub tests have the same answer and parameters as a test, but a different response value
+            for sub_test in test.sub_tests:
+                if sub_test.exclude_from_docs:
+                    continue
+
+                response = sanitise_response(sub_test.response)
+                answer = sanitise_response(test.answer)
+                correct = "✓" if sub_test.is_correct else "✗"
+
+                if sub_test.desc and len(table_lines) != 0:
+                    # Flush pending examples if necessary
+                    lines.extend(_TEST_TABLE_HEADER)
+                    lines.extend(table_lines)
+                    lines.append("")
+
+                    table_lines.clear()
+
+                table_lines.append(f"|`{response}`|`{answer}`|{correct}|")
+
+                if sub_test.desc:
+                    lines.append(sub_test.desc)
+                    lines.append("")
+
+            # Flush any remaining examples
+            if len(table_lines) != 0:
+                lines.extend(_TEST_TABLE_HEADER)
+                lines.extend(table_lines)
+                lines.append("")
+
+    return "\n".join(lines)
+
+def _first_heading_index(doc: mistletoe.Document) -> int:
+    """Find the index of the first level-1 heading in the document, or -1"""
+    return next(
+        (
+            i for i, token in enumerate(doc.children)
+            if isinstance(token, mistletoe.block_token.Heading) and token.level == 1
+        ),
+        -1,
+    )
+
 def format_response_areas(areas: List[str]) -> str:
-    out = []
-
-    if not areas or len(areas) == 0:
-        out.append("!!! warning \"Supported Response Area Types\"")
-        out.append("    This evaluation function is not configured for any Response Area components")
-    else:
-        out.append("!!! info \"Supported Response Area Types\"")
-        out.append("    This evaluation function is supported by the following Response Area components:")
-        out.append("")
-        for t in areas:
-            out.append(f"      - `{t}`")
-
-    return "\n".join(out)
+    if not areas:
+        return (
+            "!!! warning \"Supported Response Area Types\"\n"
+            "    This evaluation function is not configured for any Response Area components"
+        )
+
+    bullets = "\n".join(f"      - `{t}`" for t in areas)
+
+    return (
+        "!!! info \"Supported Response Area Types\"\n"
+        "    This evaluation function is supported by the following Response Area components:\n"
+        "\n"
+        f"{bullets}"
+    )
 
 def sanitise_response(input: str) -> str:
     # When tests are placed in tables, '|' characters delimit table cells.
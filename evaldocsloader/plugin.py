@@ -1,4 +1,5 @@
 import logging
+import concurrent.futures
 from typing import Tuple, Any, List, Dict, Optional
 
 from mkdocs.config.defaults import MkDocsConfig
@@ -7,7 +8,7 @@ from mkdocs.structure.files import File, Files
 from mkdocs.exceptions import PluginError
 
 
-from .loader_base import DocsLoader, DocsFile, Docs, DocsBundle
+from .loader_base import DocsLoader, DocsFile, DocsBundle
 from .config import EvalDocsLoaderConfig
 from .loader import FunctionLoader
 
@@ -16,43 +17,103 @@ logger = logging.getLogger("mkdocs.plugin.evaldocsloader")
 class EvalDocsLoader(BasePlugin[EvalDocsLoaderConfig]):
 
     _loader: DocsLoader = None
-    _files: List[File] = []
+    _future: Optional[concurrent.futures.Future] = None
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig | None:
+        # fail fast on a misconfigured nav before paying for any downloads;
+        # without this a typo in the section paths is only discovered after
+        # everything has been fetched
+        for name, loc in (
+            ("dev_section", self.config.dev_section),
+            ("user_section", self.config.user_section),
+        ):
+            if not config.nav or not find_nav_section(config.nav, list(loc)):
+                logger.error(f"Nav {name} path {loc} not found in nav")
+                logger.error("Disabling EvalDocsLoader plugin")
+                return config
+
         try:
             # after parsing the config, create the loader
             self._loader = FunctionLoader(self.config)
+        except Exception as e:
+            logger.error(f"Error loading Evaluation Function documentation: {e}")
+            logger.error("Disabling EvalDocsLoader plugin")
+            return config
+
+        # kick the downloads off in the background so they overlap with the
+        # rest of mkdocs' startup; the result is picked up in on_files, which
+        # runs before the nav is built
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._future = self._executor.submit(self._loader.load)
+
+        return config
+
+    def on_files(self, files: Files, /, *, config: MkDocsConfig) -> Files | None:
+        if not self._future:
+            return files
 
-            # load the documentation files
-            docs = self._loader.load()
+        try:
+            # wait for the background downloads started in on_config
+            docs = self._future.result()
 
             results: Dict[str, Dict[str, str]] = {
                 "dev": {},
                 "user": {}
             }
 
-            files = []
+            new_files = []
+            seen_paths = set()
 
+            # hoist the config lookups out of the loop; MkDocsConfig resolves
+            # attributes dynamically, so each access costs a dict dance
+            site_dir = config.site_dir
+            use_directory_urls = config.use_directory_urls
+
+            # add the downloaded files to the list of output files and store
+            # them in the results dictionary, handling both categories in one
+            # direct pass. Supplementary files reached through more than one
+            # bundle are registered only once.
             for doc in docs:
-                # add the downloaded files to the list of output files
-                # and store them in the results dictionary
-                _build_results("dev", doc, config, files, results)
-                _build_results("user", doc, config, files, results)
+                for category in ("dev", "user"):
+                    bundle: Optional[DocsBundle] = getattr(doc, category, None)
+                    if not bundle:
+                        continue
 
-            # update the nav with the new files
-            config.nav = self._update_nav(config.nav, results)
+                    file = _create_mkdocs_file(bundle.main, site_dir, use_directory_urls)
+                    new_files.append(file)
+                    seen_paths.add(bundle.main.file_path)
+                    results[category][doc.name] = file.src_path
 
-            # store the files for later use
-            self._files = files
+                    for supplementary in bundle.supplementary:
+                        if supplementary.file_path in seen_paths:
+                            continue
 
-            return config
+                        seen_paths.add(supplementary.file_path)
+                        new_files.append(_create_mkdocs_file(supplementary, site_dir, use_directory_urls))
+
+            # update the nav with the new files. mkdocs builds the nav after
+            # on_files, so changing it here is still early enough
+            config.nav = self._update_nav(config.nav, results)
         except Exception as e:
             logger.error(f"Error loading Evaluation Function documentation: {e}")
             logger.error("Disabling EvalDocsLoader plugin")
-
-    def on_files(self, files: Files, /, *, config: MkDocsConfig) -> Files | None:
-        for file in self._files:
-            files.append(file)
+            return files
+        finally:
+            self._future = None
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        # bulk-insert the downloaded files: Files.append is a per-file dict
+        # insert plus a duplicate check, so update the backing mapping in one
+        # call where the internal layout allows it
+        src_uris = getattr(files, "_src_uris", None)
+
+        if isinstance(src_uris, dict):
+            src_uris.update((f.src_uri, f) for f in new_files)
+        else:
+            for file in new_files:
+                files.append(file)
 
         return files
 
@@ -62,65 +123,111 @@ class EvalDocsLoader(BasePlugin[EvalDocsLoaderConfig]):
             self._loader.cleanup()
 
     def _update_nav(self, nav: Any, results: Dict[str, Dict[str, str]]) -> None:
-        nav, changed_dev = update_nav_section(nav, self.config.dev_section, results["dev"])
+        dev_loc = list(self.config.dev_section)
+        user_loc = list(self.config.user_section)
+
+        # the two section paths usually share a prefix; descend it once and
+        # run both updates relative to the common ancestors instead of
+        # walking the whole nav from the root twice
+        shared = 0
+        for dev_part, user_part in zip(dev_loc, user_loc):
+            if dev_part != user_part:
+                break
+            shared += 1
+
+        if shared and len(dev_loc) > shared and len(user_loc) > shared:
+            roots = find_nav_section(nav, dev_loc[:shared])
+            dev_loc = dev_loc[shared:]
+            user_loc = user_loc[shared:]
+        else:
+            roots = [nav]
+
+        changed_dev = False
+        changed_user = False
+
+        for root in roots:
+            changed_dev |= update_nav_section(root, dev_loc, results["dev"])[1]
+            changed_user |= update_nav_section(root, user_loc, results["user"])[1]
+
         if not changed_dev:
             raise PluginError("Nav dev_section path not updated")
-        
-        nav, changed_user = update_nav_section(nav, self.config.user_section, results["user"])
+
         if not changed_user:
             raise PluginError("Nav user_section path not updated")
 
         return nav
 
-def update_nav_section(nav: Any, loc: List[str], files: Dict[str, str]) -> Tuple[Any, bool]:
+def find_nav_section(nav: Any, loc: List[str]) -> List[Any]:
     """
-    Recursive method appends downloaded documentation pages in `file` to
-    the `nav` object based on the `loc` parameter
+    Collect every node at the location described by `loc`, using the same
+    descent rules as `update_nav_section`
     """
-    if len(loc) == 0:
-        # we found the location to insert the downloaded files
+    matches = []
+    stack = [(nav, loc)]
+
+    while stack:
+        node, remaining = stack.pop()
+
+        if len(remaining) == 0:
+            matches.append(node)
+
+        elif isinstance(node, dict):
+            if remaining[0] in node:
+                stack.append((node[remaining[0]], remaining[1:]))
+
+        elif isinstance(node, list):
+            stack.extend((item, remaining) for item in node)
 
-        if not isinstance(nav, list):
-            nav = [nav]
+    return matches
 
-        for k, v in files.items():
-            nav.append({k: v})
+def update_nav_section(nav: Any, loc: List[str], files: Dict[str, str]) -> Tuple[Any, bool]:
+    """
+    Appends downloaded documentation pages in `files` to the `nav` object
+    based on the `loc` parameter. The nav tree is mutated in place with a
+    single descent to the target, instead of rebuilding every node on the
+    way down.
+    """
+    entries = [{k: v} for k, v in files.items()]
+
+    # give the root a parent slot too, so a matched section that is not a
+    # list can be replaced by one in place
+    root = [nav]
 
-        return nav, True
+    # stack of (container, key, remaining location) triples, where
+    # container[key] is the node still to be descended into
+    stack = [(root, 0, loc)]
+    changed = False
 
-    if isinstance(nav, dict):
-        # build a new dict with the (potentially) updated children
-        processed_nav = {
-            k: update_nav_section(v, loc[1:], files) if k == loc[0] else (v, False)
-            for k, v in nav.items()
-        }
-        
-        # check if any of the children have changed
-        changed = any(changed for (_, changed) in processed_nav.values())
+    while stack:
+        container, key, remaining = stack.pop()
+        node = container[key]
 
-        # return the updated dict and whether it has changed
-        return {k: v for k, (v, _) in processed_nav.items()}, changed
+        if len(remaining) == 0:
+            # we found a location to insert the downloaded files
+            if not isinstance(node, list):
+                node = [node]
+                container[key] = node
 
-    elif isinstance(nav, list):
-        # build a new list with the (potentially) updated children
-        processed_nav = [update_nav_section(item, loc, files) for item in nav]
+            node.extend(entries)
+            changed = True
 
-        # check if any of the children have changed
-        changed = any(changed for (_, changed) in processed_nav)
+        elif isinstance(node, dict):
+            # descend into the child matching the next location segment
+            if remaining[0] in node:
+                stack.append((node, remaining[0], remaining[1:]))
 
-        # return the updated list and whether it has changed
-        return [item for (item, _) in processed_nav], changed
+        elif isinstance(node, list):
+            # descend into every item of the list
+            stack.extend((node, i, remaining) for i in range(len(node)))
 
-    else:
-        # return the nav object as-is and that it hasn't changed
-        return nav, False
+    return root[0], changed
     
-def _create_mkdocs_file(file: DocsFile, config: MkDocsConfig) -> File:
+def _create_mkdocs_file(file: DocsFile, site_dir: str, use_directory_urls: bool) -> File:
     f = File(
         path=file.file_path,
         src_dir=file.dir,
-        dest_dir=config.site_dir,
-        use_directory_urls=config.use_directory_urls,
+        dest_dir=site_dir,
+        use_directory_urls=use_directory_urls,
     )
 
     # disable edit_uri for downloaded pages since mkdocs
@@ -131,20 +238,4 @@ def _create_mkdocs_file(file: DocsFile, config: MkDocsConfig) -> File:
     # if file.edit_uri:
     #     f.edit_uri = file.edit_uri
 
-    return f
-
-def _build_results(category: str, docs: Docs, config: MkDocsConfig, files: List[File], results: Dict[str, Dict[str, str]]) -> None:
-    bundle: Optional[DocsBundle] = getattr(docs, category, None)
-    if not bundle:
-        return
-
-    file = _build_file(bundle.main, config, files)
-    results[category][docs.name] = file.src_path
-
-    for supplementary in bundle.supplementary:
-        _build_file(supplementary, config, files)
-
-def _build_file(file: DocsFile, config: MkDocsConfig, files: List[File]) -> File:
-    f = _create_mkdocs_file(file, config)
-    files.append(f)
     return f
\ No newline at end of file